@@ -8,6 +8,7 @@ import warnings
 import abc
 import inspect
 import dask.array as da
+from collections import OrderedDict
 
 class ColumnAccessor(da.Array):
     """
@@ -76,15 +77,49 @@ class ColumnAccessor(da.Array):
         .. note::
 
             The dask default optimizer induces too many (unnecesarry)
-            IO calls. We turn this feature off by default, and only apply a culling.
+            IO calls. We turn this feature off by default, and only apply
+            culling and task fusion; see
+            :func:`CatalogSourceBase._optimize_graph`.
+        """
+        return CatalogSourceBase._optimize_graph(dsk, keys)
 
+    def compute(self, cache=True):
+        """
+        Compute the column, returning a numpy array.
+
+        The result is cached on the catalog, keyed by the deterministic
+        dask token of the column graph, so repeated computes of an
+        identical graph (e.g. comparing several subsets against the same
+        full column) evaluate the reads and transforms only once. The
+        cache is bounded in total bytes by the ``global_cache_size``
+        global option (evicting oldest first) and is dropped when the
+        catalog's columns change.
+
+        .. warning::
+            A cached result may be returned again by a later call, so
+            treat it as read-only; pass ``cache=False`` to bypass the
+            cache and compute a private copy.
         """
-        from dask.optimization import cull
-        dsk2, dependencies = cull(dsk, keys)
-        return dsk2
+        cached = getattr(self.catalog, '_result_cache', None)
+        if not cache or cached is None:
+            return self.catalog.compute(self)
+
+        from dask.base import tokenize
+        key = tokenize(self)
+        if key in cached:
+            return cached[key]
+
+        result = self.catalog.compute(self)
+        cached[key] = result
+
+        # evict oldest entries beyond the total byte budget
+        limit = _global_options['global_cache_size']
+        total = sum(getattr(v, 'nbytes', 0) for v in cached.values())
+        while len(cached) > 1 and total > limit:
+            _, old = cached.popitem(last=False)
+            total -= getattr(old, 'nbytes', 0)
 
-    def compute(self):
-        return self.catalog.compute(self)
+        return result
 
     def __str__(self):
         r = da.Array.__str__(self)
@@ -94,6 +129,46 @@ class ColumnAccessor(da.Array):
             r = r + " last: %s" % str(self[-1].compute())
         return r
 
+def _apply_mask(a, mask):
+    """
+    Apply a boolean ``mask`` to the first axis of ``a``.
+
+    This is used block-wise when selecting a subset of a column, so a
+    whole selection collapses into a single blockwise graph layer.
+    """
+    return a[mask]
+
+def _mask_column(column, mask):
+    """
+    Select the rows of the dask array ``column`` where the numpy boolean
+    array ``mask`` is ``True``.
+
+    Rather than the low-level task graph built by dask's generic fancy
+    indexing, this emits a single blockwise layer aligned with the chunks
+    of ``column``, so consecutive selections and selections of multiple
+    columns by the same mask can be fused by the graph optimizer. The
+    output chunk sizes are computed from the mask, so the result has
+    known chunks.
+
+    Falls back to generic fancy indexing if the chunk sizes of ``column``
+    are unknown.
+    """
+    chunks = column.chunks[0]
+    if numpy.isnan(sum(chunks)):
+        return column[mask]
+
+    # the number of surviving rows in each chunk
+    bounds = numpy.concatenate([[0], numpy.cumsum(chunks)])
+    counts = tuple(int(mask[i:j].sum()) for i,j in zip(bounds[:-1], bounds[1:]))
+
+    # the mask, chunked as the column; the dask name is deterministic in
+    # the mask content, so multiple columns share a single mask layer
+    mask = da.from_array(mask, chunks=(chunks,))
+
+    out_ind = tuple(range(column.ndim))
+    return da.blockwise(_apply_mask, out_ind, column, out_ind, mask, (0,),
+                        dtype=column.dtype, adjust_chunks={0: counts})
+
 def column(name=None, is_default=False):
     """
     Decorator that defines the decorated function as a column in a
@@ -231,6 +306,10 @@ class CatalogSourceBase(object):
         # user-provided overrides and defaults for columns
         self._overrides = {}
 
+        # cached column compute results, keyed by the dask token of the
+        # column graph; see ColumnAccessor.compute
+        self._result_cache = OrderedDict()
+
         # stores memory owner
         self.base = None
 
@@ -259,7 +338,7 @@ class CatalogSourceBase(object):
         if isinstance(other, CatalogSourceBase):
             d = other.__dict__.copy()
             nocopy = ['base', '_overrides', '_hardcolumns', '_defaults', 'comm',
-                      '_size', '_csize']
+                      '_size', '_csize', '_result_cache']
             for key in d:
                 if key not in nocopy:
                     self.__dict__[key] = d[key]
@@ -300,8 +379,12 @@ class CatalogSourceBase(object):
                 if len(index) != self.size:
                     raise KeyError("slice index has length %d; should be %d" %(len(index), self.size))
 
+                # materialize the mask, so the selection can be pushed
+                # into the readers of hard columns below
+                index = self.compute(index)
+
                 # new size is just number of True entries
-                size = index.sum().compute()
+                size = int(index.sum())
             else:
 
                 if len(index) > 0 and index.dtype != numpy.integer:
@@ -309,8 +392,21 @@ class CatalogSourceBase(object):
 
                 size = len(index)
 
+        # a boolean mask can be pushed into the readers of hard columns,
+        # so that only the surviving rows are read from disk
+        pushdown = isinstance(index, numpy.ndarray) and index.dtype == numpy.dtype('?')
+        owner = self if self.base is None else self.base
+
         # initialize subset Source of right size
-        subset_data = {col:self[col][index] for col in self if not self[col].is_default}
+        subset_data = {}
+        for col in self:
+            if self[col].is_default: continue
+            if pushdown and col not in owner._overrides:
+                subset_data[col] = ColumnAccessor(owner, self.get_hardcolumn(col, selection=index))
+            elif pushdown:
+                subset_data[col] = _mask_column(self[col], index)
+            else:
+                subset_data[col] = self[col][index]
         if size <= 0.51 * self.size:
             # if the subsample ratio is substential, then always make
             # a copy to decouple from the original data
@@ -401,6 +497,9 @@ class CatalogSourceBase(object):
         """
         if self.base is not None: return self.base.__setitem__(col, value)
 
+        # the column definitions changed; drop any cached results
+        getattr(self, '_result_cache', {}).clear()
+
         self._overrides[col] = self.make_column(value)
 
     def __delitem__(self, col):
@@ -421,6 +520,7 @@ class CatalogSourceBase(object):
 
         if col in self._overrides:
             del self._overrides[col]
+            getattr(self, '_result_cache', {}).clear()
             return
 
         raise ValueError("unable to delete column '%s' from CatalogSource" %col)
@@ -506,7 +606,7 @@ class CatalogSourceBase(object):
 
         return toret
 
-    def get_hardcolumn(self, col):
+    def get_hardcolumn(self, col, selection=None):
         """
         Construct and return a hard-coded column.
 
@@ -516,17 +616,90 @@ class CatalogSourceBase(object):
         Subclasses may override this method and the hardcolumns attribute to
         bypass the decorator logic.
 
+        If ``selection`` is provided (a boolean mask or integer index over
+        the local data), only the selected rows are returned. Subclasses
+        reading from disk can use this to avoid reading the full column.
+
         .. note::
             If the :attr:`base` attribute is set, ``get_hardcolumn()``
             will called using :attr:`base` instead of ``self``.
         """
-        if self.base is not None: return self.base.get_hardcolumn(col)
+        if self.base is not None: return self.base.get_hardcolumn(col, selection=selection)
 
         if col in self._hardcolumns:
-            return getattr(self, col)()
+            r = getattr(self, col)()
+            if selection is not None:
+                if isinstance(selection, numpy.ndarray) and selection.dtype == numpy.dtype('?'):
+                    r = _mask_column(r, selection)
+                else:
+                    r = r[selection]
+            return r
         else:
             raise ValueError("no such hard-coded column %s" %col)
 
+    @staticmethod
+    def _optimize_graph(dsk, keys):
+        """
+        Optimize a dask graph before computing the given keys.
+
+        The graph is first culled to the tasks that contribute to
+        ``keys``. The remaining tasks are then colored: source tasks get
+        distinct colors, and colors propagate forward in topological
+        order, a task inheriting the color shared by all of its inputs
+        and starting a new color where colors merge. A reverse pass marks
+        tasks whose dependents carry mixed colors as group boundaries.
+
+        Same-colored runs between the boundaries -- the per-column
+        transform chains, including diamonds over a shared input column
+        -- are finally collapsed into single tasks with
+        :func:`dask.optimization.fuse`, cutting the per-task scheduling
+        overhead when many columns are computed at once.
+
+        This is used by :func:`ColumnAccessor.__dask_optimize__`, and
+        hence by :func:`compute` for any combination of columns.
+        """
+        import dask
+        from dask.core import flatten, toposort
+        from dask.optimization import cull, fuse
+
+        keys = list(flatten(keys))
+        dsk, dependencies = cull(dsk, keys)
+
+        # forward pass: inherit the color shared by all inputs; tasks
+        # where different colors meet start a new color
+        colors = {}
+        ncolors = 0
+        for k in toposort(dsk, dependencies=dependencies):
+            cs = set(colors[d] for d in dependencies[k])
+            if len(cs) == 1:
+                colors[k] = cs.pop()
+            else:
+                colors[k] = ncolors
+                ncolors += 1
+
+        # reverse pass: a task whose dependents do not all share its own
+        # color sits on a group boundary and must stay materialized
+        dependents = dict((k, []) for k in dsk)
+        for k in dsk:
+            for d in dependencies[k]:
+                dependents[d].append(k)
+
+        protected = set(keys)
+        for k in dsk:
+            if any(colors[d] != colors[k] for d in dependents[k]):
+                protected.add(k)
+
+        # collapse the same-colored groups; ave_width bounds how wide a
+        # fused group may be (diamonds need > 1)
+        try:
+            ave_width = dask.config.get('fuse_ave_width', 2)
+        except AttributeError:
+            ave_width = 2
+
+        dsk, dependencies = fuse(dsk, list(protected), dependencies=dependencies,
+                                 ave_width=ave_width)
+        return dsk
+
     def compute(self, *args, **kwargs):
         """
         Our version of :func:`dask.compute` that computes
@@ -559,7 +732,8 @@ class CatalogSourceBase(object):
         if len(toret) == 1: toret = toret[0]
         return toret
 
-    def save(self, output, columns=None, dataset=None, datasets=None, header='Header', compute=True):
+    def save(self, output, columns=None, dataset=None, datasets=None, header='Header',
+                compute=True, dtype=None):
         """
         Save the CatalogSource to a :class:`bigfile.BigFile`.
 
@@ -585,6 +759,12 @@ class CatalogSourceBase(object):
             if True, wait till the store operations finish
             if False, return a dictionary with column name and a future object for the store.
             use dask.compute() to wait for the store operations on the result.
+        dtype : numpy.dtype, str, or dict, optional
+            if given, cast the columns to this data type before writing,
+            e.g., ``'f4'`` to store float64 columns in single precision,
+            halving the file size and the read bandwidth later; a dict
+            gives a dtype per column name, with missing columns written
+            unchanged. The default preserves the in-memory data types.
         """
         import bigfile
         import json
@@ -624,7 +804,9 @@ class CatalogSourceBase(object):
                     assert step1 == 1
                     assert start1 == 0
                     assert stop1 == value.shape[1]
-                self.bb.write(start, value)
+                # bigfile writes the buffer as-is; make sure the rows are
+                # interleaved contiguously, even if the dask chunk is a view
+                self.bb.write(start, numpy.ascontiguousarray(value))
 
         with bigfile.FileMPI(comm=self.comm, filename=output, create=True) as ff:
 
@@ -635,6 +817,13 @@ class CatalogSourceBase(object):
             # save meta data and create blocks, prepare for the write.
             for column, dataset in zip(columns, datasets):
                 array = self[column]
+
+                # optionally downcast the column before writing
+                if dtype is not None:
+                    dt = dtype.get(column, None) if isinstance(dtype, dict) else dtype
+                    if dt is not None and numpy.dtype(dt) != array.dtype:
+                        array = array.astype(dt)
+
                 # ensure data is only chunked in the first dimension
                 size = self.comm.allreduce(len(array))
                 offset = numpy.sum(self.comm.allgather(len(array))[:self.comm.rank], dtype='i8')
@@ -644,11 +833,11 @@ class CatalogSourceBase(object):
 
                 Nfile = (size + sizeperfile - 1) // sizeperfile
 
-                dtype = numpy.dtype((array.dtype, array.shape[1:]))
+                blockdtype = numpy.dtype((array.dtype, array.shape[1:]))
 
                 # save column attrs too
                 # first create the block on disk
-                with ff.create(dataset, dtype, size, Nfile) as bb:
+                with ff.create(dataset, blockdtype, size, Nfile) as bb:
                     if hasattr(array, 'attrs'):
                         for key in array.attrs:
                             bb.attrs[key] = array.attrs[key]
@@ -685,14 +874,16 @@ class CatalogSourceBase(object):
 
             # lock=False to avoid dask from pickling the lock with the object.
             if compute:
-                # write blocks one by one
-                for column, source, target, region in zip(columns, sources, targets, regions):
-                    if self.comm.rank == 0:
-                        self.logger.info("started writing column %s" % column)
-                    source.store(target, regions=region, lock=False, compute=True)
+                # write all blocks in a single store pass, so the column
+                # graphs are scheduled (and any shared ancestors computed)
+                # together, rather than once per column
+                if self.comm.rank == 0:
+                    self.logger.info("started writing columns %s" % str(columns))
+                da.store(sources, targets, regions=regions, lock=False, compute=True)
+                for target in targets:
                     target.bb.close()
-                    if self.comm.rank == 0:
-                        self.logger.info("finished writing column %s" % column)
+                if self.comm.rank == 0:
+                    self.logger.info("finished writing columns %s" % str(columns))
                 future = None
             else:
                 # return a future that writes all blocks at the same time.
@@ -1079,23 +1270,28 @@ class CatalogSource(CatalogSourceBase):
         """
         Return a CatalogSource, where the selected columns are
         computed and persist in memory.
+
+        The columns are computed in a single pass over the graphs, and
+        the results stay chunked: downstream operations on the returned
+        catalog start from the in-memory chunks, rather than repeating
+        the reads and transforms that produced them. ``self`` is left
+        untouched.
         """
+        import dask
 
-        import dask.array as da
         if columns is None:
             columns = self.columns
 
-        r = {}
-        for key in columns:
-            r[key] = self[key]
+        # compute all requested columns in one pass; the returned dask
+        # arrays hold the concrete chunk data in their graphs
+        arrs = [self[col].as_daskarray() for col in columns]
+        persisted = dask.persist(*arrs)
 
-        r = da.compute(r)[0] # particularity of dask
+        toret = self.copy()
+        for col, arr in zip(columns, persisted):
+            toret[col] = arr
 
-        from nbodykit.source.catalog.array import ArrayCatalog
-        c = ArrayCatalog(r, comm=self.comm)
-        c.attrs.update(self.attrs)
-
-        return c
+        return toret
 
     def sort(self, keys, reverse=False, usecols=None):
         """
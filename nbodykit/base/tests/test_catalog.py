@@ -1,6 +1,7 @@
 from runtests.mpi import MPITest
 from nbodykit.lab import *
 from nbodykit import setup_logging, set_options
+from nbodykit.utils import AllConcatArray
 
 import os
 import pytest
@@ -63,7 +64,7 @@ def test_save_future(comm):
 
     # check the data
     def allconcat(data):
-        return numpy.concatenate(comm.allgather(data), axis=0)
+        return AllConcatArray(numpy.asarray(data), comm)
 
     assert_allclose(allconcat(source['Position']), allconcat(source2['Position']))
     assert_allclose(allconcat(source['Velocity']), allconcat(source2['Velocity']))
@@ -115,7 +116,7 @@ def test_save_dataset(comm):
 
     # check the data
     def allconcat(data):
-        return numpy.concatenate(comm.allgather(data), axis=0)
+        return AllConcatArray(numpy.asarray(data), comm)
 
     assert_allclose(allconcat(source['Position']), allconcat(source2['Position']))
     assert_allclose(allconcat(source['Velocity']), allconcat(source2['Velocity']))
@@ -170,7 +171,7 @@ def test_save(comm):
 
     # check the data
     def allconcat(data):
-        return numpy.concatenate(comm.allgather(data), axis=0)
+        return AllConcatArray(numpy.asarray(data), comm)
     assert_allclose(allconcat(source['Position']), allconcat(source2['Position']))
     assert_allclose(allconcat(source['Velocity']), allconcat(source2['Velocity']))
 
@@ -178,6 +179,61 @@ def test_save(comm):
     if comm.rank == 0:
         shutil.rmtree(tmpfile)
 
+@MPITest([1])
+def test_save_dtype(comm):
+
+    import tempfile
+    import shutil
+
+    # initialize an output directory
+    if comm.rank == 0:
+        tmpfile = tempfile.mkdtemp()
+    else:
+        tmpfile = None
+    tmpfile = comm.bcast(tmpfile)
+
+    # initialize a uniform catalog
+    source = UniformCatalog(nbar=2e-4, BoxSize=512., seed=42, comm=comm)
+
+    # save, downcasting Position but not Velocity
+    source.save(tmpfile, ['Position', 'Velocity'], dtype={'Position':'f4'})
+
+    # load as a BigFileCatalog
+    source2 = BigFileCatalog(tmpfile, comm=comm)
+
+    # the stored dtypes
+    assert source2['Position'].dtype == numpy.dtype('f4')
+    assert source2['Velocity'].dtype == source['Velocity'].dtype
+
+    # the data round-trips to single precision
+    assert_allclose(source['Position'], source2['Position'], rtol=1e-6)
+    assert_array_equal(source['Velocity'], source2['Velocity'])
+
+    comm.barrier()
+    if comm.rank == 0:
+        shutil.rmtree(tmpfile)
+
+@MPITest([1])
+def test_compute_cache(comm):
+
+    source = UniformCatalog(nbar=2e-4, BoxSize=512., seed=42, comm=comm)
+
+    # repeated computes of the identical graph hit the cache
+    a = source['Position'].compute()
+    b = source['Position'].compute()
+    assert b is a
+
+    # bypassing the cache gives a private copy
+    c = source['Position'].compute(cache=False)
+    assert c is not a
+    assert_array_equal(a, c)
+
+    # changing the columns drops the cached results
+    source['Weight'] = 10.
+    d = source['Position'].compute()
+    assert d is not a
+    assert_array_equal(a, d)
+
 @MPITest([1, 4])
 def test_tomesh(comm):
 
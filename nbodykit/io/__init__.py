@@ -6,3 +6,4 @@ from .stack import FileStack
 from .tpm import TPMBinaryFile
 from .gadget import Gadget1File
 from .fits import FITSFile
+from .parquet import ParquetFile
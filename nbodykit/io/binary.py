@@ -3,6 +3,7 @@ import os
 
 from .base import FileType
 from . import tools
+from nbodykit import _global_options
 from six import string_types
 
 def getsize(filename, header_size, rowsize):
@@ -120,6 +121,64 @@ class BinaryFile(FileType):
 
         return offset
 
+    def _mpi_read(self, column, start, stop):
+        """
+        Read a single column over the range ``[start, stop)`` through
+        MPI-IO.
+
+        The file is opened with ``MPI.MODE_RDONLY`` on ``MPI.COMM_SELF``
+        and the byte span of the requested rows is read with ``Read_at``
+        into a preallocated buffer, so each rank pulls only its own bytes
+        directly from the shared file and the aggregate bandwidth scales
+        with the number of ranks on a parallel file system.
+
+        .. note::
+            The collective ``Read_at_all`` variant is deliberately not
+            used: the reads are issued lazily from within dask tasks,
+            where there is no guarantee that all ranks participate.
+        """
+        from mpi4py import MPI
+
+        dtype = self.dtype[column]
+        offset = self.offsets[column] + start * dtype.itemsize
+
+        buf = numpy.empty(stop - start, dtype=dtype)
+        fh = MPI.File.Open(MPI.COMM_SELF, self.path, MPI.MODE_RDONLY)
+        try:
+            fh.Read_at(offset, buf)
+        finally:
+            fh.Close()
+        return buf
+
+    def get_dask(self, column, blocksize=None):
+        """
+        Return the specified column as a dask array, with one task per
+        chunk that reads its own byte span via :func:`_mpi_read`.
+
+        This avoids funneling the reads through a single Python file
+        object, so chunks computed on different ranks (or threads) read
+        from the file independently.
+        """
+        if blocksize is None:
+            blocksize = _global_options['dask_chunk_size']
+
+        if column not in self:
+            raise ValueError("'%s' is not a valid column; run keys() for valid options" %column)
+
+        import dask
+        import dask.array as da
+
+        dtype = self.dtype[column]
+        chunks = []
+        for start in range(0, self.size, int(blocksize)):
+            stop = min(start + int(blocksize), self.size)
+            chunk = dask.delayed(self._mpi_read)(column, start, stop)
+            chunks.append(da.from_delayed(chunk, (stop-start,) + dtype.shape, dtype.base))
+
+        if not len(chunks):
+            return da.from_array(numpy.empty((0,)+dtype.shape, dtype=dtype.base), chunks=-1)
+        return da.concatenate(chunks, axis=0)
+
     def read(self, columns, start, stop, step=1):
         """
         Read the specified column(s) over the given range
@@ -6,6 +6,50 @@ from six import string_types
 from .base import FileType
 from . import tools
 
+def _parse_block_fast(block, config):
+    """
+    Parse a whitespace-delimited, purely floating-point byte block
+    directly with :func:`numpy.fromstring`, bypassing the pandas
+    tokenizer.
+
+    Returns ``None`` when the read configuration (or the data itself)
+    rules the fast path out, in which case the caller falls back to
+    :func:`pandas.read_csv`.
+    """
+    names = config.get('names', None)
+    if not names:
+        return None
+
+    # only the plain configuration: whitespace delimited, every column
+    # kept, no rows skipped, truncated, or specially converted
+    if not config.get('delim_whitespace', False):
+        return None
+    if not config.get('skip_blank_lines', True):
+        return None
+    for key in ['usecols', 'skiprows', 'nrows', 'converters', 'na_values']:
+        if config.get(key, None):
+            return None
+
+    # every column must be explicitly float64
+    dtypes = config.get('dtype', None)
+    if not isinstance(dtypes, dict):
+        return None
+    for col in names:
+        if col not in dtypes or numpy.dtype(dtypes[col]) != numpy.dtype('f8'):
+            return None
+
+    try:
+        data = numpy.fromstring(block, dtype='f8', sep=' ')
+    except (ValueError, TypeError):
+        return None
+
+    # non-numeric fields give a partial (ragged) parse
+    if data.size % len(names) != 0:
+        return None
+
+    from pandas import DataFrame
+    return DataFrame(data.reshape(-1, len(names)), columns=list(names))
+
 class CSVPartition(object):
     """
     A simple class to convert byte strings of data from a CSV file
@@ -53,13 +97,76 @@ class CSVPartition(object):
             with open(self.filename, 'rb') as f:
                 block = read_block(f, self.offset, self.blocksize, self.delimiter)
 
-            # parse the byte string
-            b = BytesIO()
-            b.write(block); b.seek(0)
-            self._value = read_csv(b, **self.config)
+            # try the direct numeric parser first
+            value = _parse_block_fast(block, self.config)
+
+            # fall back to parsing the byte string with pandas
+            if value is None:
+                b = BytesIO()
+                b.write(block); b.seek(0)
+                value = read_csv(b, **self.config)
 
+            self._value = value
             return self._value
 
+def _partition_index_path(filename):
+    """
+    The path of the sidecar partition index for ``filename``.
+
+    The index is a hidden file next to the data file, so it is not picked
+    up by the glob patterns users pass to select their data files.
+    """
+    dirname, basename = os.path.split(filename)
+    return os.path.join(dirname, '.' + basename + '.nbkidx')
+
+def _partition_index_key(filename, blocksize):
+    """
+    The validation key stored with the sidecar partition index: the file
+    byte size, its modification time, and the partition block size.
+    """
+    st = os.stat(filename)
+    return numpy.array([st.st_size, st.st_mtime_ns, blocksize], dtype='i8')
+
+def _load_partition_index(filename, blocksize):
+    """
+    Load the cached per-partition row counts from the sidecar index file
+    next to ``filename``.
+
+    Returns ``None`` if no index exists, or if it is stale (the file has
+    been modified, or was partitioned with a different block size).
+    """
+    sidecar = _partition_index_path(filename)
+    if not os.path.exists(sidecar):
+        return None
+    try:
+        data = numpy.load(sidecar)
+    except (IOError, OSError, ValueError):
+        return None
+    key = _partition_index_key(filename, blocksize)
+    if data.ndim != 1 or len(data) < 3 or not numpy.array_equal(data[:3], key):
+        return None
+    return data[3:]
+
+def _save_partition_index(filename, blocksize, sizes):
+    """
+    Save the per-partition row counts to the sidecar index file next to
+    ``filename``, prefixed by the validation key.
+
+    This is best-effort: failures (e.g., a read-only directory) are
+    silently ignored and the file will simply be re-scanned next time.
+    """
+    sidecar = _partition_index_path(filename)
+    key = _partition_index_key(filename, blocksize)
+    data = numpy.concatenate([key, numpy.asarray(sizes, dtype='i8')])
+    tmp = sidecar + '.%d.tmp' % os.getpid()
+    try:
+        with open(tmp, 'wb') as ff:
+            numpy.save(ff, data)
+        os.replace(tmp, sidecar)
+    except (IOError, OSError):
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
 def make_partitions(filename, blocksize, config, delimiter="\n"):
     """
     Partition a CSV file into blocks, using the preferred blocksize
@@ -110,6 +217,17 @@ def make_partitions(filename, blocksize, config, delimiter="\n"):
     # number of rows to read
     nrows = config.pop('nrows', None)
 
+    # the sizes can be re-used from the sidecar index when they do not
+    # depend on the read configuration
+    cacheable = nrows is None and not config.get('skiprows', None)
+    if cacheable:
+        sizes = _load_partition_index(filename, blocksize)
+        if sizes is not None and len(sizes) == len(offsets):
+            config['nrows'] = None
+            partitions = [CSVPartition(filename, offset, blocksize, delimiter, **config)
+                            for offset in offsets]
+            return partitions, [int(s) for s in sizes]
+
     sizes = []; partitions = []
     with open(filename, 'rb') as f:
         for i, offset in enumerate(offsets):
@@ -151,7 +269,10 @@ def make_partitions(filename, blocksize, config, delimiter="\n"):
 
             sizes.append(size)
 
-
+    # remember the sizes, keyed by the file's mtime and byte size, so the
+    # next open of an unchanged file skips the scan entirely
+    if cacheable:
+        _save_partition_index(filename, blocksize, sizes)
 
     return partitions, sizes
 
@@ -283,6 +404,10 @@ class CSVFile(FileType):
         config['usecols'] = usecols
         config.setdefault('engine', 'c')
         config.setdefault('skip_blank_lines', True)
+
+        # missing values are treated as a configuration error (see
+        # verify_data), so skip the NA sentinel scan of every field
+        config.setdefault('na_filter', False)
         self.pandas_config = config.copy()
 
         # verify the data
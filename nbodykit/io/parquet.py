@@ -0,0 +1,96 @@
+from .base import FileType
+from . import tools
+from six import string_types
+import numpy
+
+try: from pyarrow import parquet
+except ImportError: parquet = None
+
+class ParquetFile(FileType):
+    """
+    A file object to handle the reading of columns of data from an
+    Apache Parquet file, using the :mod:`pyarrow` package.
+
+    See https://arrow.apache.org/docs/python/parquet.html for
+    documentation on :mod:`pyarrow.parquet`.
+
+    Parquet stores the data column-by-column within each row group, so
+    only the bytes of the requested columns are ever read from disk.
+    The row groups serve as the natural partitions of the file (stored
+    as :attr:`_sizes`), analogous to the byte blocks of
+    :class:`~nbodykit.io.csv.CSVFile`.
+
+    Parameters
+    ----------
+    path : str
+        the file path to load
+    """
+    def __init__(self, path):
+
+        if parquet is None:
+            raise ImportError("please install pyarrow to use ParquetFile")
+
+        self.path = path
+        self.dataset = "*"
+        self.attrs = {}
+
+        pf = parquet.ParquetFile(path)
+        meta = pf.metadata
+        self.size = meta.num_rows
+
+        # the equivalent numpy dtype of the arrow schema
+        schema = pf.schema.to_arrow_schema()
+        dtype = []
+        for name in schema.names:
+            dtype.append((str(name), schema.field(name).type.to_pandas_dtype()))
+        self.dtype = numpy.dtype(dtype)
+
+        # the number of rows in each row group; these are the
+        # partitions of the file
+        self._sizes = [meta.row_group(i).num_rows for i in range(meta.num_row_groups)]
+
+    def read(self, columns, start, stop, step=1):
+        """
+        Read the specified column(s) over the given range
+
+        'start' and 'stop' should be between 0 and :attr:`size`,
+        which is the total size of the file
+
+        Only the row groups overlapping the requested range are read,
+        and only the bytes of the requested columns.
+
+        Parameters
+        ----------
+        columns : str, list of str
+            the name of the column(s) to return
+        start : int
+            the row integer to start reading at
+        stop : int
+            the row integer to stop reading at
+        step : int, optional
+            the step size to use when reading; default is 1
+
+        Returns
+        -------
+        numpy.array
+            structured array holding the requested columns over
+            the specified range of rows
+        """
+        if isinstance(columns, string_types): columns = [columns]
+
+        # re-open the file on each read, so the file object stays
+        # picklable (the reads happen lazily from within dask tasks)
+        pf = parquet.ParquetFile(self.path)
+
+        toret = []
+        for fnum in tools.get_file_slice(self._sizes, start, stop):
+
+            # the local slice
+            sl = tools.global_to_local_slice(self._sizes, start, stop, fnum)
+
+            # read this row group and slice
+            data = pf.read_row_group(fnum, columns=columns).to_pandas()
+            data = data[sl[0]:sl[1]]
+            toret.append(data[columns].to_records(index=False))
+
+        return numpy.concatenate(toret, axis=0)[::step]
@@ -1,10 +1,24 @@
 from .base import FileType
 from . import tools
+from nbodykit import _global_options
 from six import string_types
 import numpy
 import os
 import inspect
 
+def _masked_read(ff, column, indices):
+    """
+    Read the rows of ``column`` from the file object ``ff`` selected
+    by the sorted integer array ``indices``.
+
+    Only the bounding row range of ``indices`` is read from disk, and
+    the index is applied locally to the resulting array.
+    """
+    start = int(indices[0])
+    stop = int(indices[-1]) + 1
+    data = ff.read([column], start, stop)[column]
+    return data[indices - start]
+
 class FileStack(FileType):
     """
     A file object that offers a continuous view of a stack of subclasses of
@@ -49,26 +63,109 @@ class FileStack(FileType):
                 filenames = [os.path.abspath(path)]
         else:
             raise ValueError("'path' should be a string or a list of strings")
-        self.files = [filetype(fn, *args, **kwargs) for fn in filenames]
-        self.sizes = numpy.array([len(f) for f in self.files], dtype='i8')
+        # remember how to open the files, so the stack can be rebuilt
+        # from its metadata alone on other ranks
+        self.filetype = filetype
+        self._filenames = filenames
+        self._args = args
+        self._kwargs = kwargs
+        self._attrs = None
+        self._partition_boundaries = None
+        self._partitions_known = False
+
+        self._files = [filetype(fn, *args, **kwargs) for fn in filenames]
+        self.sizes = numpy.array([len(f) for f in self._files], dtype='i8')
 
         # set dtype and size
-        self.dtype = self.files[0].dtype
+        self.dtype = self._files[0].dtype
         self.size  = self.sizes.sum()
 
     def __repr__(self):
         return "FileStack(%s, ... %d files)" % (repr(self.files[0]), self.nfiles)
 
+    def _metadata(self):
+        """
+        The lightweight state needed to rebuild the stack on another rank,
+        without serializing the file objects themselves.
+        """
+        return {'path': self.path,
+                'filenames': list(self._filenames),
+                'filetype': self.filetype,
+                'args': self._args,
+                'kwargs': self._kwargs,
+                'dtype': self.dtype,
+                'sizes': numpy.asarray(self.sizes, dtype='i8'),
+                'partitions': self.partition_boundaries(),
+                'attrs': dict(self.attrs)}
+
+    @classmethod
+    def _from_metadata(cls, meta):
+        """
+        Rebuild a FileStack from the metadata dict returned by
+        :func:`_metadata`.
+
+        The file objects are not created here; they are re-opened lazily
+        on the first access to :attr:`files`, i.e., when data is actually
+        read on this rank.
+        """
+        self = object.__new__(cls)
+        self.path = meta['path']
+        self.filetype = meta['filetype']
+        self._filenames = meta['filenames']
+        self._args = meta['args']
+        self._kwargs = meta['kwargs']
+        self._attrs = meta['attrs']
+        self._partition_boundaries = meta['partitions']
+        self._partitions_known = True
+        self._files = None
+        self.sizes = meta['sizes']
+        self.dtype = meta['dtype']
+        self.size = self.sizes.sum()
+        return self
+
+    @property
+    def files(self):
+        """
+        The list of file objects in the stack.
+
+        On ranks where the stack was rebuilt from metadata, the files are
+        opened on first access.
+        """
+        if self._files is None:
+            self._files = [self.filetype(fn, *self._args, **self._kwargs) for fn in self._filenames]
+        return self._files
+
     @property
     def attrs(self):
         """
         Dictionary of meta-data for the stack
         """
+        if self._attrs is not None:
+            return self._attrs
         if hasattr(self.files[0], 'attrs'):
             return self.files[0].attrs
         else:
             return {}
 
+    def partition_boundaries(self):
+        """
+        The cumulative row offsets of the byte partitions of the
+        underlying files, starting at 0 and ending at :attr:`size`.
+
+        Returns ``None`` when the files are not internally partitioned
+        into byte blocks (only :class:`~nbodykit.io.csv.CSVFile` is).
+
+        On ranks where the stack was rebuilt from metadata, the answer
+        (including ``None``) was computed on the root rank and carried
+        in the broadcast, so this never opens the files.
+        """
+        if not self._partitions_known:
+            if all(hasattr(f, '_sizes') for f in self.files):
+                sizes = numpy.concatenate([numpy.asarray(f._sizes, dtype='i8') for f in self.files])
+                self._partition_boundaries = numpy.insert(numpy.cumsum(sizes), 0, 0)
+            self._partitions_known = True
+        return self._partition_boundaries
+
     @property
     def nfiles(self):
         """
@@ -76,6 +173,95 @@ class FileStack(FileType):
         """
         return len(self.files)
 
+    def get_dask(self, column, blocksize=None, indices=None):
+        """
+        Return the specified column as a dask array.
+
+        If ``indices`` is provided, only the selected rows are read from
+        disk: the index is split along the file boundaries, and one dask
+        task is emitted per file, which reads the bounding row range of
+        the surviving rows in that file and applies the index locally.
+        Files with no surviving rows are never touched.
+
+        Parameters
+        ----------
+        column : str
+            the name of the column to return
+        blocksize : int, optional
+            the size of the chunks in the dask array
+        indices : array_like, optional
+            a boolean mask or sorted integer index array, specifying the
+            rows (in the global indexing of the stack) to read
+
+        Returns
+        -------
+        :class:`dask.array.Array` :
+            the dask array holding the column, which computes the
+            necessary functions to read the data, but delays evaluating
+            until the user specifies
+        """
+        if indices is None:
+
+            # a single-file stack delegates to the file's own get_dask
+            # when the file type specializes it (e.g. the MPI-IO read
+            # path of BinaryFile)
+            if self.nfiles == 1 and type(self.files[0]).get_dask is not FileType.get_dask:
+                return self.files[0].get_dask(column, blocksize=blocksize)
+
+            if column not in self:
+                raise ValueError("'%s' is not a valid column; run keys() for valid options" %column)
+
+            import dask.array as da
+
+            # build the explicit chunk sizes, never spanning a file
+            # boundary, so each task reads from a single file: files
+            # that are internally partitioned (e.g. the byte blocks of
+            # CSVFile, the row groups of ParquetFile) contribute their
+            # partition row counts, and the rest are split into pieces
+            # of roughly ``blocksize`` rows
+            chunks = []
+            for f, fsize in zip(self.files, self.sizes):
+                if blocksize is None and hasattr(f, '_sizes'):
+                    chunks.extend(int(s) for s in f._sizes)
+                else:
+                    bs = int(blocksize) if blocksize is not None else int(_global_options['dask_chunk_size'])
+                    chunks.extend(min(bs, int(fsize) - start) for start in range(0, int(fsize), bs))
+            if not len(chunks): chunks = [0]
+
+            chunks = (tuple(chunks),) + self.dtype[column].shape
+            return da.from_array(self[column], chunks=chunks)
+
+        if column not in self:
+            raise ValueError("'%s' is not a valid column; run keys() for valid options" %column)
+
+        import dask
+        import dask.array as da
+
+        indices = numpy.asarray(indices)
+        if indices.dtype == numpy.dtype('?'):
+            indices = numpy.flatnonzero(indices)
+
+        # cumulative file sizes, to split the index along file boundaries
+        cumsizes = numpy.insert(numpy.cumsum(self.sizes), 0, 0)
+
+        dtype = self.dtype[column]
+        chunks = []
+        for fnum in range(self.nfiles):
+
+            # the local part of the index belonging to this file
+            sl = numpy.searchsorted(indices, [cumsizes[fnum], cumsizes[fnum+1]])
+            shape = (int(sl[1]-sl[0]),) + dtype.shape
+
+            if sl[1] == sl[0]:
+                # fully-masked file -- never read from it
+                chunk = dask.delayed(numpy.empty)(shape, dtype.base)
+            else:
+                local = indices[sl[0]:sl[1]] - cumsizes[fnum]
+                chunk = dask.delayed(_masked_read)(self.files[fnum], column, local)
+            chunks.append(da.from_delayed(chunk, shape, dtype.base))
+
+        return da.concatenate(chunks, axis=0)
+
     def read(self, columns, start, stop, step=1):
         """
         Read the specified column(s) over the given range,
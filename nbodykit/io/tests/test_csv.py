@@ -1,12 +1,30 @@
 from runtests.mpi import MPITest
 from nbodykit.io.csv import CSVFile
+from nbodykit.io.csv import (_partition_index_path,
+                             _load_partition_index,
+                             _save_partition_index)
 import os
+import glob
 import numpy
 import tempfile
 import pickle
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clean_partition_index():
+    """
+    Remove the partition index sidecars written next to the temporary
+    data files during each test.
+    """
+    yield
+    for fn in glob.glob(os.path.join(tempfile.gettempdir(), '.*.nbkidx')):
+        try:
+            os.unlink(fn)
+        except OSError:
+            pass
+
+
 @MPITest([1])
 def test_no_trailing_newline(comm):
 
@@ -265,3 +283,48 @@ def test_invalid_keywords(comm):
         for k,v in bad_kws.items():
             with pytest.raises(ValueError):
                 f = CSVFile(path=ff.name, names=names, blocksize=1000, **{k:v})
+
+@MPITest([1])
+def test_partition_index(comm):
+
+    with tempfile.NamedTemporaryFile() as ff:
+
+        # generate data
+        data = numpy.random.random(size=(100,5))
+        numpy.savetxt(ff, data, fmt='%.7e'); ff.seek(0)
+
+        # the first open scans the file and writes the sidecar index
+        names =['a', 'b', 'c', 'd', 'e']
+        f = CSVFile(path=ff.name, names=names, blocksize=1000)
+
+        sidecar = _partition_index_path(ff.name)
+        assert os.path.exists(sidecar)
+
+        # the stored sizes match the scanned partition sizes
+        sizes = _load_partition_index(ff.name, 1000)
+        assert [int(s) for s in sizes] == [int(s) for s in f._sizes]
+
+        # the cached sizes are actually used on re-open: doctor the
+        # sidecar and check the new file object picks the sizes up
+        fake = [int(s) for s in f._sizes]
+        fake[0] += 1; fake[-1] -= 1
+        _save_partition_index(ff.name, 1000, fake)
+        f2 = CSVFile(path=ff.name, names=names, blocksize=1000)
+        assert [int(s) for s in f2._sizes] == fake
+
+        # restore the real index; a cached open reads the same data
+        _save_partition_index(ff.name, 1000, f._sizes)
+        f3 = CSVFile(path=ff.name, names=names, blocksize=1000)
+        numpy.testing.assert_almost_equal(data[:,0], f3['a'][:], decimal=7)
+
+        # a different blocksize misses the cache
+        assert _load_partition_index(ff.name, 500) is None
+
+        # modifying the file invalidates the index
+        ff.seek(0, 2)
+        numpy.savetxt(ff, data, fmt='%.7e'); ff.flush()
+        assert _load_partition_index(ff.name, 1000) is None
+
+        # and a re-open falls back to the scan, seeing the new rows
+        f4 = CSVFile(path=ff.name, names=names, blocksize=1000)
+        assert f4.size == 200
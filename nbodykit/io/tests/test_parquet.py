@@ -0,0 +1,76 @@
+from runtests.mpi import MPITest
+from nbodykit.io.parquet import ParquetFile
+
+import os
+import numpy
+import tempfile
+import pickle
+import contextlib
+import pytest
+
+try: import pyarrow
+except ImportError: pyarrow = None
+
+@contextlib.contextmanager
+def temporary_data(row_group_size=256):
+    """
+    Write some temporary Parquet data to disk
+    """
+    import pandas as pd
+    from pyarrow import parquet
+
+    try:
+        # generate data
+        names = ['a', 'b', 'c', 'd']
+        data = numpy.random.random(size=(1024, 4))
+        df = pd.DataFrame(data, columns=names)
+
+        # write to file
+        tmpfile = tempfile.mkstemp(suffix='.parquet')[1]
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        parquet.write_table(table, tmpfile, row_group_size=row_group_size)
+
+        yield (data, names, tmpfile)
+    except:
+        raise
+    finally:
+        os.unlink(tmpfile)
+
+@MPITest([1])
+@pytest.mark.skipif(pyarrow is None, "pyarrow is not installed")
+def test_data(comm):
+
+    with temporary_data() as (data, names, tmpfile):
+
+        # read
+        f = ParquetFile(tmpfile)
+
+        # check columns and size
+        assert(all(col in names for col in f.columns))
+        numpy.testing.assert_equal(f.size, 1024)
+
+        # row groups are the partitions
+        assert(f._sizes == [256]*4)
+
+        # make sure data is the same
+        for i, col in enumerate(names):
+            numpy.testing.assert_almost_equal(data[:,i], f[col][:])
+
+        # try a slice crossing a row-group boundary
+        data2 = f.read(names, 200, 600, 1)
+        for i, col in enumerate(names):
+            numpy.testing.assert_almost_equal(data[200:600,i], data2[col])
+
+@MPITest([1])
+@pytest.mark.skipif(pyarrow is None, "pyarrow is not installed")
+def test_pickle(comm):
+
+    with temporary_data() as (data, names, tmpfile):
+
+        # read and pickle
+        f = ParquetFile(tmpfile)
+        s = pickle.dumps(f)
+        f2 = pickle.loads(s)
+
+        # same data
+        numpy.testing.assert_almost_equal(data[:,0], f2['a'][:])
@@ -6,6 +6,7 @@ from .file import HDFCatalog
 from .file import TPMBinaryCatalog
 from .file import FITSCatalog
 from .file import Gadget1Catalog
+from .file import ParquetCatalog
 
 from .array import ArrayCatalog
 from .lognormal import LogNormalCatalog
@@ -21,6 +22,7 @@ __all__ = ['CSVCatalog',
            'TPMBinaryCatalog',
            'FITSCatalog',
            'Gadget1Catalog',
+           'ParquetCatalog',
            'ArrayCatalog',
            'LogNormalCatalog',
            'UniformCatalog', 'RandomCatalog',
@@ -74,13 +74,16 @@ class ArrayCatalog(CatalogSource):
         defaults = CatalogSource.hardcolumns.fget(self)
         return list(self._dtype.names) + defaults
 
-    def get_hardcolumn(self, col):
+    def get_hardcolumn(self, col, selection=None):
         """
         Return a column from the underlying data array/dict.
 
         Columns are returned as dask arrays.
         """
         if col in self._dtype.names:
+            if selection is not None:
+                # apply the selection in numpy, before the dask conversion
+                return self.make_column(self._source[col][selection])
             return self.make_column(self._source[col])
         else:
-            return CatalogSource.get_hardcolumn(self, col)
+            return CatalogSource.get_hardcolumn(self, col, selection=selection)
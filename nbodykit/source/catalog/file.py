@@ -5,12 +5,29 @@ from nbodykit import io
 from nbodykit.extern import docrep
 
 from six import string_types
+import functools
+import numpy
 import textwrap
 import os
 
 __all__ = ['FileCatalogFactory', 'FileCatalogBase',
            'CSVCatalog', 'BinaryCatalog', 'BigFileCatalog',
-           'HDFCatalog', 'TPMBinaryCatalog', 'Gadget1Catalog', 'FITSCatalog']
+           'HDFCatalog', 'TPMBinaryCatalog', 'Gadget1Catalog', 'FITSCatalog',
+           'ParquetCatalog']
+
+def _snap_offsets(offsets, bounds):
+    """
+    Internal function to snap each entry of the sorted ``offsets`` array
+    to the nearest value in the sorted ``bounds`` array.
+
+    The result is monotonically non-decreasing, and the end points are
+    preserved (they are always boundaries themselves).
+    """
+    j = numpy.searchsorted(bounds, offsets)
+    j = numpy.clip(j, 1, len(bounds)-1)
+    left, right = bounds[j-1], bounds[j]
+    snapped = numpy.where(offsets - left <= right - offsets, left, right)
+    return numpy.maximum.accumulate(snapped)
 
 class FileCatalogBase(CatalogSource):
     """
@@ -40,16 +57,35 @@ class FileCatalogBase(CatalogSource):
         self.comm = comm
         self.filetype = filetype
 
-        # bcast the FileStack
+        # build the FileStack on the root rank and bcast only the
+        # lightweight metadata (paths, dtype, sizes, attrs); the other
+        # ranks rebuild the stack locally, re-opening files lazily,
+        # instead of unpickling the reader objects from the root
         if self.comm.rank == 0:
             self._source = FileStack(filetype, *args, **kwargs)
+            meta = self._source._metadata()
         else:
-            self._source = None
-        self._source = self.comm.bcast(self._source)
+            meta = None
+        meta = self.comm.bcast(meta)
+        if self.comm.rank != 0:
+            self._source = FileStack._from_metadata(meta)
+
+        # the rank partition offsets: rank i holds rows
+        # [_offsets[i], _offsets[i+1]) of the full file
+        N = self._source.size
+        self._offsets = (numpy.arange(self.comm.size+1, dtype='i8') * N) // self.comm.size
+
+        # for byte-partitioned files (CSV), snap the rank boundaries to
+        # the partition boundaries, so no byte block is parsed by more
+        # than one rank; only done when the partitions are fine enough
+        # that the snapping cannot skew the rank sizes badly
+        bounds = self._source.partition_boundaries()
+        if bounds is not None and len(bounds) - 1 >= 2 * self.comm.size:
+            self._offsets = _snap_offsets(self._offsets, bounds)
 
         # compute the size; start with full file.
-        lstart = self.comm.rank * self._source.size // self.comm.size
-        lend = (self.comm.rank  + 1) * self._source.size // self.comm.size
+        lstart = int(self._offsets[self.comm.rank])
+        lend = int(self._offsets[self.comm.rank+1])
         self._size = lend - lstart
 
         self.start = 0
@@ -91,8 +127,9 @@ class FileCatalogBase(CatalogSource):
             raise ValueError("cannot seek if columns have been attached to the FileCatalog")
 
         other = self.copy()
-        other._lstart = self.start + start +  self.comm.rank * (end - start) // self.comm.size
-        other._lend = self.start + start + (self.comm.rank + 1) * (end - start) // self.comm.size
+        other._offsets = self.start + start + (numpy.arange(self.comm.size+1, dtype='i8') * (end - start)) // self.comm.size
+        other._lstart = int(other._offsets[self.comm.rank])
+        other._lend = int(other._offsets[self.comm.rank+1])
         other._size = other._lend - other._lstart
         other.start = start
         other.end = end
@@ -114,23 +151,42 @@ class FileCatalogBase(CatalogSource):
         defaults = CatalogSource.hardcolumns.fget(self)
         return list(self._source.dtype.names) + defaults
 
-    def get_hardcolumn(self, col):
+    def get_hardcolumn(self, col, selection=None):
         """
         Return a column from the underlying file source.
 
         Columns are returned as dask arrays.
+
+        If ``selection`` is provided (a boolean mask or sorted integer
+        index, local to this rank), it is pushed down into the
+        :class:`~nbodykit.io.stack.FileStack`, so that only the selected
+        rows are read from disk.
         """
         if col in self._source.dtype.names:
+            if selection is not None:
+                sel = numpy.asarray(selection)
+                if sel.dtype == numpy.dtype('?'):
+                    sel = numpy.flatnonzero(sel)
+                # shift to the global row numbers of this rank's slab
+                return self._source.get_dask(col, indices=sel + self._lstart)
             return self._source.get_dask(col)[self._lstart:self._lend]
         else:
-            return CatalogSource.get_hardcolumn(self, col)
+            return CatalogSource.get_hardcolumn(self, col, selection=selection)
+
 
+# a single processor shared by all _make_docstring calls; creating one
+# per call re-parses the docstring machinery on every import
+_DOCREP = docrep.DocstringProcessor()
 
+@functools.lru_cache(maxsize=None)
 def _make_docstring(filetype, examples):
     """
     Internal function to generate the doc strings for the built-in
     CatalogSource objects that rely on :mod:`nbodykit.io` classes
     to read data from disk.
+
+    The result is memoized on ``(filetype, examples)``, since the
+    factory is invoked for every built-in catalog class at import time.
     """
 
     qualname = '%s.%s' %(filetype.__module__, filetype.__name__)
@@ -159,9 +215,8 @@ Please see :ref:`the documentation <%s>` for examples.
 """ %examples
 
     # get the Parameters from the IO libary class
-    d = docrep.DocstringProcessor()
-    d.get_sections(d.dedents(filetype.__doc__), 'test', ['Parameters'])
-    return d.dedents(__doc__)
+    _DOCREP.get_sections(_DOCREP.dedents(filetype.__doc__), 'test', ['Parameters'])
+    return _DOCREP.dedents(__doc__)
 
 def FileCatalogFactory(name, filetype, examples=None):
     """
@@ -204,3 +259,4 @@ HDFCatalog       = FileCatalogFactory("HDFCatalog", io.HDFFile, examples='hdf-da
 TPMBinaryCatalog = FileCatalogFactory("TPMBinaryCatalog", io.TPMBinaryFile)
 FITSCatalog      = FileCatalogFactory("FITSCatalog", io.FITSFile, examples='fits-data')
 Gadget1Catalog   = FileCatalogFactory("Gadget1Catalog", io.Gadget1File, examples=None)
+ParquetCatalog   = FileCatalogFactory("ParquetCatalog", io.ParquetFile, examples=None)
@@ -60,5 +60,7 @@ class SubVolumesCatalog(CatalogSource):
     def hardcolumns(self):
         return sorted(list(self._frozen.keys()))
 
-    def get_hardcolumn(self, col):
+    def get_hardcolumn(self, col, selection=None):
+        if selection is not None:
+            return self._frozen[col][selection]
         return self._frozen[col]
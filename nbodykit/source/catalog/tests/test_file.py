@@ -1,6 +1,7 @@
 from runtests.mpi import MPITest
 from nbodykit.lab import *
 from nbodykit import setup_logging
+from nbodykit.io.csv import _partition_index_path
 from numpy.testing import assert_allclose
 import tempfile
 import os
@@ -91,6 +92,48 @@ def test_csv(comm):
         # make sure all the columns are there
         assert all(col in f for col in names)
 
+        # remove the partition index written next to the data file
+        sidecar = _partition_index_path(ff.name)
+        if os.path.exists(sidecar):
+            os.unlink(sidecar)
+
+@MPITest([1, 4])
+def test_csv_selection(comm):
+
+    tmpfile1 = 'test-select-1.dat'
+    tmpfile2 = 'test-select-2.dat'
+
+    # generate data, split across two files
+    numpy.random.seed(42)
+    data = numpy.random.random(size=(100,5))
+    if comm.rank == 0:
+        numpy.savetxt(tmpfile1, data[:50], fmt='%.7e')
+        numpy.savetxt(tmpfile2, data[50:], fmt='%.7e')
+    comm.barrier()
+
+    # the small blocksize gives many byte partitions per file, so the
+    # rank boundaries snap to the partition boundaries
+    names =['a', 'b', 'c', 'd', 'e']
+    f = CSVCatalog([tmpfile1, tmpfile2], names, blocksize=100, comm=comm)
+
+    # select a range; the boolean mask is pushed down into the file reads
+    index = (f['a'] > 0.3) & (f['a'] < 0.7)
+    subset = f[index]
+
+    # the pushed-down selection equals masking the computed column
+    mask = numpy.concatenate(comm.allgather(index.compute()))
+    for i, name in enumerate(names):
+        sel = numpy.concatenate(comm.allgather(subset[name].compute()))
+        numpy.testing.assert_almost_equal(data[mask][:,i], sel, decimal=7)
+
+    comm.barrier()
+    if comm.rank == 0:
+        for fn in [tmpfile1, tmpfile2]:
+            os.unlink(fn)
+            sidecar = _partition_index_path(fn)
+            if os.path.exists(sidecar):
+                os.unlink(sidecar)
+
 @MPITest([1])
 def test_stack_glob(comm):
 
@@ -117,8 +160,11 @@ def test_stack_glob(comm):
     # make sure all the columns are there
     assert all(col in f for col in names)
 
-    os.unlink(tmpfile1)
-    os.unlink(tmpfile2)
+    for fn in [tmpfile1, tmpfile2]:
+        os.unlink(fn)
+        sidecar = _partition_index_path(fn)
+        if os.path.exists(sidecar):
+            os.unlink(sidecar)
 
 @MPITest([1])
 def test_stack_list(comm):
@@ -146,5 +192,8 @@ def test_stack_list(comm):
     # make sure all the columns are there
     assert all(col in f for col in names)
 
-    os.unlink(tmpfile1)
-    os.unlink(tmpfile2)
+    for fn in [tmpfile1, tmpfile2]:
+        os.unlink(fn)
+        sidecar = _partition_index_path(fn)
+        if os.path.exists(sidecar):
+            os.unlink(sidecar)
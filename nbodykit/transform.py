@@ -3,11 +3,44 @@ import dask.array as da
 from six import string_types
 from nbodykit.utils import deprecate
 from nbodykit import _global_options
+
+try: import numba
+except ImportError: numba = None
+
+def _sky_to_cartesian_kernel(ra, dec, r):
+    """
+    Internal kernel converting (``ra``, ``dec``, ``r``), with angles in
+    radians, to Cartesian coordinates; returns a (N,3) array.
+
+    When :mod:`numba` is installed, this is replaced by a compiled,
+    thread-parallel version that computes each row in a single pass.
+    """
+    out = numpy.empty((ra.shape[0], 3), dtype=ra.dtype)
+    cosdec = numpy.cos(dec)
+    out[:,0] = cosdec * numpy.cos(ra) * r
+    out[:,1] = cosdec * numpy.sin(ra) * r
+    out[:,2] = numpy.sin(dec) * r
+    return out
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True)
+    def _sky_to_cartesian_kernel(ra, dec, r): # noqa: F811
+        out = numpy.empty((ra.shape[0], 3), dtype=ra.dtype)
+        for i in numba.prange(ra.shape[0]):
+            c = numpy.cos(dec[i])
+            out[i,0] = c * numpy.cos(ra[i]) * r[i]
+            out[i,1] = c * numpy.sin(ra[i]) * r[i]
+            out[i,2] = numpy.sin(dec[i]) * r[i]
+        return out
+
 def StackColumns(*cols):
     """
     Stack the input dask arrays vertically, column by column.
 
-    This uses :func:`dask.array.vstack`.
+    This uses :func:`dask.array.stack` along the trailing axis, so each
+    output chunk is assembled in a single blockwise step (which can fuse
+    with downstream elementwise operations), rather than transposing a
+    vertically stacked array.
 
     Parameters
     ----------
@@ -25,7 +58,9 @@ def StackColumns(*cols):
         If the input columns are not dask arrays
     """
     cols = da.broadcast_arrays(*cols)
-    return da.vstack(cols).T
+
+    # keep the trailing axis unchunked, so each row lives in one chunk
+    return da.stack(cols, axis=-1).rechunk({1: -1})
 
 def ConcatenateSources(*sources, **kwargs):
     """
@@ -366,13 +401,30 @@ def SkyToCartesian(ra, dec, redshift, cosmo, observer=[0, 0, 0], degrees=True, f
     """
     ra, dec, redshift = da.broadcast_arrays(ra, dec, redshift)
 
-    # pos on the unit sphere
-    pos = SkyToUnitSphere(ra, dec, degrees=degrees, frame=frame)
-
-    # multiply by the comoving distance in Mpc/h
+    # the comoving distance in Mpc/h
     r = redshift.map_blocks(lambda z: cosmo.comoving_distance(z), dtype=redshift.dtype)
 
-    return r[:,None] * pos + observer
+    if frame == 'icrs':
+        # put into radians from degrees
+        if degrees:
+            ra  = da.deg2rad(ra)
+            dec = da.deg2rad(dec)
+
+        # cast to a common dtype, so the kernel sees uniform inputs
+        dtype = numpy.result_type(ra.dtype, dec.dtype, r.dtype)
+        ra, dec, r = (a.astype(dtype) for a in (ra, dec, r))
+
+        # compute each chunk in a single fused (and, with numba,
+        # compiled and thread-parallel) pass over the rows
+        pos = da.map_blocks(_sky_to_cartesian_kernel, ra, dec, r,
+                            new_axis=1, chunks=(ra.chunks[0], (3,)), dtype=dtype)
+        return pos + observer
+    else:
+        # pos on the unit sphere
+        pos = SkyToUnitSphere(ra, dec, degrees=degrees, frame=frame)
+
+        # multiply by the comoving distance in Mpc/h
+        return r[:,None] * pos + observer
 
 def HaloConcentration(mass, cosmo, redshift, mdef='vir'):
     """
@@ -240,6 +240,32 @@ def GatherArray(data, comm, root=0):
 
     return recvbuffer
 
+def AllConcatArray(data, comm):
+    """
+    Concatenate the input data array from all ranks, returning the
+    result on every rank.
+
+    This is a drop-in replacement for the common
+    ``numpy.concatenate(comm.allgather(data))`` idiom: it uses
+    ``Allgatherv`` on a preallocated contiguous buffer (via
+    :func:`GatherArray` with ``root=Ellipsis``), which avoids mpi4py
+    pickling each rank's array, and also avoids the 2 GB mpi4py limit
+    for bytes using a custom datatype.
+
+    Parameters
+    ----------
+    data : array_like
+        the data on each rank to concatenate
+    comm : MPI communicator
+        the MPI communicator
+
+    Returns
+    -------
+    recvbuffer : array_like
+        the concatenated data, on all ranks
+    """
+    return GatherArray(data, comm, root=Ellipsis)
+
 def ScatterArray(data, comm, root=0, counts=None):
     """
     Scatter the input data array across all ranks, assuming `data` is